@@ -1,7 +1,21 @@
 """Core pandas schema component specifications."""
 
+import re
 import warnings
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from functools import lru_cache
+from itertools import repeat
+from operator import attrgetter
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    Union,
+)
 
 import pandas as pd
 
@@ -17,8 +31,75 @@ from pandera.api.pandas.container import DataFrameSchema
 from pandera.api.pandas.types import CheckList, PandasDtypeInputTypes
 from pandera.dtypes import UniqueSettings
 
+# keys of the ``Column.properties`` dictionary, which map one-to-one to the
+# keyword arguments of the ``Column`` constructor.
+_COLUMN_PROPERTIES = (
+    "dtype",
+    "checks",
+    "nullable",
+    "unique",
+    "report_duplicates",
+    "coerce",
+    "required",
+    "name",
+    "regex",
+    "title",
+    "description",
+)
+# column properties compared as-is by Column.__eq__. Checks are compared
+# separately, irrespective of their order.
+_get_column_signature = attrgetter(
+    *(key for key in _COLUMN_PROPERTIES if key != "checks")
+)
+
+
+@lru_cache(maxsize=None)
+def _non_interactive_example_warning() -> Type[Warning]:
+    """Get the warning category hypothesis emits when calling ``example``."""
+    # pylint: disable=import-outside-toplevel,cyclic-import,import-error
+    import hypothesis
+
+    return hypothesis.errors.NonInteractiveExampleWarning
+
+
+def _to_frame(series: pd.Series) -> pd.DataFrame:
+    """Convert a generated series into a single-column dataframe."""
+    return series.to_frame()
+
+
+def _signature_value(value: Any) -> Any:
+    """Convert a schema attribute value into an immutable value that is equal
+    to another converted value whenever the original values are equal.
+    """
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, dict):
+        return frozenset(value.items())
+    return value
+
+
+class _SignatureMixin:
+    """Compare schema components by their attributes and hash them by their
+    signature, an immutable tuple of the schema's attribute name-value pairs.
+    """
+
+    @property
+    def _signature(self) -> Tuple[Any, ...]:
+        """Attribute name-value pairs used to hash schema components."""
+        return tuple(
+            (k, _signature_value(v)) for k, v in sorted(self.__dict__.items())
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self.__dict__ == other.__dict__
+
+    def __hash__(self):
+        return hash(self._signature)
 
-class Column(ArraySchema):
+
+class Column(_SignatureMixin, ArraySchema):
     """Validate types and properties of DataFrame columns."""
 
     BACKEND = ColumnBackend()
@@ -91,10 +172,10 @@ class Column(ArraySchema):
             description=description,
         )
         if (
-            name is not None
+            regex
+            and name is not None
             and not isinstance(name, str)
             and not is_valid_multiindex_key(name)
-            and regex
         ):
             raise ValueError(
                 "You cannot specify a non-string name when setting regex=True"
@@ -125,6 +206,30 @@ class Column(ArraySchema):
             "description": self.description,
         }
 
+    @property
+    def _signature(self) -> Tuple[Any, ...]:
+        """Property values used to compare and hash columns."""
+        return (*_get_column_signature(self), frozenset(self.checks))
+
+    def __eq__(self, other):
+        if not isinstance(other, self.__class__):
+            return NotImplemented
+        return self._signature == other._signature
+
+    def __hash__(self):
+        return hash(self._signature)
+
+    @property
+    def _compiled_regex(self) -> Union[Pattern, Tuple[Pattern, ...], None]:
+        """Compiled ``name`` pattern, or one pattern per column index level
+        if ``name`` is a tuple.
+        """
+        if isinstance(self.name, tuple):
+            return tuple(re.compile(name) for name in self.name)
+        if self.name is not None:
+            return re.compile(self.name)
+        return None
+
     def set_name(self, name: str):
         """Used to set or modify the name of a column object.
 
@@ -182,18 +287,6 @@ class Column(ArraySchema):
         """
         return self.BACKEND.get_regex_columns(self, columns)
 
-    def __eq__(self, other):
-        if not isinstance(other, self.__class__):
-            return NotImplemented
-
-        def _compare_dict(obj):
-            return {
-                k: v if k != "_checks" else set(v)
-                for k, v in obj.__dict__.items()
-            }
-
-        return _compare_dict(self) == _compare_dict(other)
-
     ############################
     # Schema Transform Methods #
     ############################
@@ -205,7 +298,7 @@ class Column(ArraySchema):
         :param size: number of elements to generate
         :returns: a dataframe strategy for a single column.
         """
-        return super().strategy(size=size).map(lambda x: x.to_frame())
+        return super().strategy(size=size).map(_to_frame)
 
     @st.strategy_import_error
     def strategy_component(self):
@@ -223,13 +316,9 @@ class Column(ArraySchema):
         :param size: number of elements in the generated Index.
         :returns: pandas DataFrame object.
         """
-        # pylint: disable=import-outside-toplevel,cyclic-import,import-error
-        import hypothesis
-
         with warnings.catch_warnings():
             warnings.simplefilter(
-                "ignore",
-                category=hypothesis.errors.NonInteractiveExampleWarning,
+                "ignore", category=_non_interactive_example_warning()
             )
             return (
                 super()
@@ -240,7 +329,7 @@ class Column(ArraySchema):
             )
 
 
-class Index(ArraySchema):
+class Index(_SignatureMixin, ArraySchema):
     """Validate types and properties of a DataFrame Index."""
 
     BACKEND = IndexBackend()
@@ -293,9 +382,6 @@ class Index(ArraySchema):
             inplace=inplace,
         )
 
-    def __eq__(self, other):
-        return self.__dict__ == other.__dict__
-
     ###########################
     # Schema Strategy Methods #
     ###########################
@@ -332,18 +418,14 @@ class Index(ArraySchema):
         :param size: number of elements in the generated Index.
         :returns: pandas Index object.
         """
-        # pylint: disable=import-outside-toplevel,cyclic-import,import-error
-        import hypothesis
-
         with warnings.catch_warnings():
             warnings.simplefilter(
-                "ignore",
-                category=hypothesis.errors.NonInteractiveExampleWarning,
+                "ignore", category=_non_interactive_example_warning()
             )
             return self.strategy(size=size).example()
 
 
-class MultiIndex(DataFrameSchema):
+class MultiIndex(_SignatureMixin, DataFrameSchema):
     """Validate types and properties of a DataFrame MultiIndex.
 
     This class inherits from :class:`~pandera.api.pandas.container.DataFrameSchema` to
@@ -407,14 +489,13 @@ class MultiIndex(DataFrameSchema):
         See :ref:`here<multiindex>` for more usage details.
 
         """
-        if any(not isinstance(i, Index) for i in indexes):
-            raise errors.SchemaInitError(
-                f"expected a list of Index objects, found {indexes} "
-                f"of type {[type(x) for x in indexes]}"
-            )
-        self.indexes = indexes
         columns = {}
         for i, index in enumerate(indexes):
+            if not isinstance(index, Index):
+                raise errors.SchemaInitError(
+                    f"expected a list of Index objects, found {indexes} "
+                    f"of type {[type(x) for x in indexes]}"
+                )
             if not ordered and index.name is None:
                 # if the MultiIndex is not ordered, there's no way of
                 # determining how to get the index level without an explicit
@@ -423,20 +504,26 @@ class MultiIndex(DataFrameSchema):
                     "You must specify index names if MultiIndex schema "
                     "component is not ordered."
                 )
-            columns[i if index.name is None else index.name] = Column(
+            key = i if index.name is None else index.name
+            columns[key] = Column(
                 dtype=index._dtype,
-                checks=index.checks,
+                checks=[*index.checks],
                 nullable=index.nullable,
                 unique=index.unique,
+                name=key,
             )
+        self.indexes = indexes
         super().__init__(
-            columns=columns,
             coerce=coerce,
             strict=strict,
             name=name,
             ordered=ordered,
             unique=unique,
         )
+        # the level columns are owned by this MultiIndex and already named
+        # after their keys, so they are set directly instead of being passed
+        # to DataFrameSchema, which would deep-copy and rename each of them.
+        self.columns = columns
 
     @property
     def names(self):
@@ -505,10 +592,11 @@ class MultiIndex(DataFrameSchema):
     def __str__(self):
         indent = " " * 4
 
-        indexes_str = "[\n"
-        for index in self.indexes:
-            indexes_str += f"{indent * 2}{index}\n"
-        indexes_str += f"{indent}]"
+        indexes_str = (
+            "[\n"
+            + "".join(f"{indent * 2}{index}\n" for index in self.indexes)
+            + f"{indent}]"
+        )
 
         return (
             f"<Schema {self.__class__.__name__}(\n"
@@ -520,9 +608,6 @@ class MultiIndex(DataFrameSchema):
             ")>"
         )
 
-    def __eq__(self, other):
-        return self.__dict__ == other.__dict__
-
     ###########################
     # Schema Strategy Methods #
     ###########################
@@ -538,17 +623,13 @@ class MultiIndex(DataFrameSchema):
     # https://github.com/pandera-dev/pandera/issues/403
     # pylint: disable=arguments-differ
     def example(self, size=None) -> pd.MultiIndex:  # type: ignore
-        # pylint: disable=import-outside-toplevel,cyclic-import,import-error
-        import hypothesis
-
         with warnings.catch_warnings():
             warnings.simplefilter(
-                "ignore",
-                category=hypothesis.errors.NonInteractiveExampleWarning,
+                "ignore", category=_non_interactive_example_warning()
             )
             return self.strategy(size=size).example()
 
 
 def is_valid_multiindex_key(x: Tuple[Any, ...]) -> bool:
     """Check that a multi-index tuple key has all string elements"""
-    return isinstance(x, tuple) and all(isinstance(i, str) for i in x)
+    return isinstance(x, tuple) and all(map(isinstance, x, repeat(str)))
@@ -3,6 +3,7 @@
 from functools import partial
 from typing import Dict, List, Optional, Union, cast
 
+import numpy as np
 import pandas as pd
 from multimethod import overload, DispatchError
 
@@ -170,6 +171,17 @@ class PandasCheckBackend(BaseCheckBackend):
         if not check_obj.index.equals(check_output.index):
             return None
 
+        if self.check.n_failure_cases is not None and type(
+            check_obj
+        ).__module__.startswith("pandas"):
+            # select the first n failure cases by position instead of
+            # materializing all of them before truncating.
+            return check_obj.iloc[
+                np.flatnonzero(
+                    (~check_output).to_numpy(dtype=bool, na_value=False)
+                )[: self.check.n_failure_cases]
+            ]
+
         failure_cases = check_obj[~check_output]
         if not failure_cases.empty and self.check.n_failure_cases is not None:
             # NOTE: this is a hack to support pyspark.pandas and modin, since you
@@ -1,8 +1,18 @@
 """Backend implementation for pandas schema components."""
 
+import re
 import traceback
-from copy import copy, deepcopy
-from typing import Iterable, Optional, Union
+from copy import copy
+from operator import attrgetter, methodcaller
+from typing import (
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Union,
+    cast,
+)
 
 import numpy as np
 import pandas as pd
@@ -20,6 +30,92 @@ from pandera.error_handlers import SchemaErrorHandler
 from pandera.errors import SchemaError, SchemaErrors
 
 
+# regex patterns consisting only of these characters match themselves.
+_LITERAL_PATTERN = re.compile(r"[A-Za-z0-9_\-]*")
+
+
+def _is_non_empty_line(label: str) -> bool:
+    """Equivalent of matching the ``.+`` pattern from the start of a label."""
+    return label[:1] not in ("", "\n")
+
+
+def _regex_fastpath(pattern: Pattern) -> Optional[Callable[[str], bool]]:
+    """Get a string predicate equivalent to ``pattern.match`` for trivial
+    patterns, i.e. ``.*``, ``.+``, ``literal`` and ``literal.*`` with an
+    optional leading ``^``.
+
+    :param pattern: compiled regex pattern.
+    :returns: predicate function or None if ``pattern`` isn't trivial.
+    """
+    if pattern.flags != re.UNICODE:
+        return None
+    source = pattern.pattern
+    if source.startswith("^"):
+        source = source[1:]
+    if source == ".+":
+        return _is_non_empty_line
+    if source.endswith(".*"):
+        source = source[:-2]
+    if _LITERAL_PATTERN.fullmatch(source):
+        return methodcaller("startswith", source)
+    return None
+
+
+def _match_regex(pattern: Pattern, labels: pd.Index) -> np.ndarray:
+    """Get a boolean mask of the string labels that match a compiled regex.
+
+    :param pattern: compiled regex pattern, matched from the start of labels.
+    :param labels: string labels to match.
+    :returns: boolean numpy array with the same length as ``labels``.
+    """
+    str_labels = cast(Iterable[str], labels)
+    predicate = _regex_fastpath(pattern)
+    if predicate is None:
+        match = pattern.match
+        return np.fromiter(
+            (match(label) is not None for label in str_labels),
+            dtype=bool,
+            count=len(labels),
+        )
+    return np.fromiter(
+        map(predicate, str_labels), dtype=bool, count=len(labels)
+    )
+
+
+def _match_level_regex(
+    pattern: Pattern, columns: Union[pd.Index, pd.MultiIndex], level: int
+) -> np.ndarray:
+    """Get a boolean mask of the columns whose label at ``level`` matches a
+    compiled regex.
+
+    For MultiIndex columns, only the unique values of the level are converted
+    to strings and matched, the result is then broadcast to all columns using
+    the level codes.
+
+    :param pattern: compiled regex pattern, matched from the start of labels.
+    :param columns: columns to match.
+    :param level: position of the level to match.
+    :returns: boolean numpy array with the same length as ``columns``.
+    """
+    if not is_multiindex(columns):
+        return _match_regex(
+            pattern, columns.get_level_values(level).astype(str)
+        )
+    columns = cast(pd.MultiIndex, columns)
+    codes = np.asarray(columns.codes[level])
+    # missing labels have code -1 and are not part of the level values, the
+    # appended slot keeps the lookup valid and is overwritten below.
+    matches = np.append(
+        _match_regex(pattern, columns.levels[level].astype(str)), False
+    )[codes]
+    missing = codes == -1
+    if missing.any():
+        matches[missing] = _match_regex(
+            pattern, columns.get_level_values(level)[missing].astype(str)
+        )
+    return matches
+
+
 class ColumnBackend(ArraySchemaBackend):
     """Backend implementation for pandas dataframe columns."""
 
@@ -36,6 +132,7 @@ class ColumnBackend(ArraySchemaBackend):
         inplace: bool = False,
     ) -> pd.DataFrame:
         """Validation backend implementation for pandas dataframe columns.."""
+        # pylint: disable=too-many-locals
         if not inplace:
             check_obj = check_obj.copy()
 
@@ -50,12 +147,12 @@ class ColumnBackend(ArraySchemaBackend):
                 "method.",
             )
 
-        def validate_column(check_obj, column_name):
+        def validate_column(check_obj, column_schema):
             try:
                 # pylint: disable=super-with-arguments
                 super(ColumnBackend, self).validate(
                     check_obj,
-                    copy(schema).set_name(column_name),
+                    column_schema,
                     head=head,
                     tail=tail,
                     sample=sample,
@@ -64,10 +161,7 @@ class ColumnBackend(ArraySchemaBackend):
                     inplace=inplace,
                 )
             except SchemaErrors as err:
-                for err_dict in err.schema_errors:
-                    error_handler.collect_error(
-                        err_dict["reason_code"], err_dict["error"]
-                    )
+                error_handler.extend(err.schema_errors)
             except SchemaError as err:
                 error_handler.collect_error(err.reason_code, err)
 
@@ -85,13 +179,19 @@ class ColumnBackend(ArraySchemaBackend):
                     error_handler=error_handler,
                 )
 
-            if is_table(check_obj[column_name]):
-                for i in range(check_obj[column_name].shape[1]):
-                    validate_column(
-                        check_obj[column_name].iloc[:, [i]], column_name
-                    )
+            # collected errors keep a reference to the schema they were raised
+            # with, so regex-matched columns need their own named copy.
+            column_schema = (
+                schema
+                if column_name is schema.name
+                else copy(schema).set_name(column_name)
+            )
+            column = check_obj[column_name]
+            if is_table(column):
+                for i in range(column.shape[1]):
+                    validate_column(column.iloc[:, [i]], column_schema)
             else:
-                validate_column(check_obj, column_name)
+                validate_column(check_obj, column_schema)
 
         if lazy and error_handler.collected_errors:
             raise SchemaErrors(
@@ -119,12 +219,11 @@ class ColumnBackend(ArraySchemaBackend):
                     f"MultiIndex columns with {len(schema.name)} number of "
                     f"levels, found {columns.nlevels} level(s)"
                 )
-            matches = np.ones(len(columns)).astype(bool)
-            for i, name in enumerate(schema.name):
-                matched = pd.Index(
-                    columns.get_level_values(i).astype(str).str.match(name)
-                ).fillna(False)
-                matches = matches & np.array(matched.tolist())
+            matches = np.ones(len(columns), dtype=bool)
+            for i, pattern in enumerate(schema._compiled_regex):
+                matches &= _match_level_regex(pattern, columns, i)
+                if not matches.any():
+                    break
             column_keys_to_check = columns[matches]
         else:
             if is_multiindex(columns):
@@ -134,22 +233,19 @@ class ColumnBackend(ArraySchemaBackend):
                     "pd.MultiIndex object"
                 )
             column_keys_to_check = columns[
-                # str.match will return nan values when the index value is
-                # not a string.
-                pd.Index(columns.astype(str).str.match(schema.name))
-                .fillna(False)
-                .tolist()
+                _match_regex(schema._compiled_regex, columns.astype(str))
             ]
         if column_keys_to_check.shape[0] == 0:
+            column_names = columns.tolist()
             raise SchemaError(
                 schema=schema,
                 data=columns,
                 message=(
                     f"Column regex name='{schema.name}' did not match any "
                     "columns in the dataframe. Update the regex pattern so "
-                    f"that it matches at least one column:\n{columns.tolist()}",
+                    f"that it matches at least one column:\n{column_names}",
                 ),
-                failure_cases=scalar_failure_case(str(columns.tolist())),
+                failure_cases=scalar_failure_case(str(column_names)),
                 check=f"no_regex_column_match('{schema.name}')",
             )
         # drop duplicates to account for potential duplicated columns in the
@@ -173,14 +269,19 @@ class ColumnBackend(ArraySchemaBackend):
                 schema=schema,
                 error_handler=error_handler,
             )
-        return check_obj.apply(
-            lambda x: super(ColumnBackend, self).coerce_dtype(
-                x,
-                schema=schema,
-                error_handler=error_handler,
-            ),
+        coerced = pd.concat(
+            [
+                super(ColumnBackend, self).coerce_dtype(
+                    check_obj.iloc[:, i],
+                    schema=schema,
+                    error_handler=error_handler,
+                )
+                for i in range(check_obj.shape[1])
+            ],
             axis="columns",
         )
+        coerced.columns = check_obj.columns
+        return coerced
 
     def run_checks(self, check_obj, schema, error_handler, lazy):
         check_results = []
@@ -296,10 +397,12 @@ class MultiIndexBackend(DataFrameSchemaBackend):
         if not schema.coerce:
             return check_obj
 
-        error_handler = SchemaErrorHandler(lazy=True)
+        # only created once a coercion error needs to be collected.
+        error_handler = None
 
         # construct MultiIndex with coerced data types
-        coerced_multi_index = {}
+        coerced_multi_index: List[Optional[pd.Index]]
+        coerced_multi_index = [None] * check_obj.nlevels
         for i, index in enumerate(schema.indexes):
             if all(x is None for x in schema.names):
                 index_levels = [i]
@@ -313,46 +416,53 @@ class MultiIndexBackend(DataFrameSchemaBackend):
                 index_array = check_obj.get_level_values(index_level)
                 if index.coerce or schema._coerce:
                     try:
-                        _index = deepcopy(index)
+                        _index = copy(index)
                         _index.coerce = True
                         index_array = _index.coerce_dtype(index_array)
                     except SchemaError as err:
+                        if error_handler is None:
+                            error_handler = SchemaErrorHandler(lazy=True)
                         error_handler.collect_error(
                             "dtype_coercion_error", err
                         )
                 coerced_multi_index[index_level] = index_array
 
-        if error_handler.collected_errors:
+        if error_handler is not None:
             raise SchemaErrors(
                 schema=schema,
                 schema_errors=error_handler.collected_errors,
                 data=check_obj,
             )
 
+        # The level arrays may have a dtype different than 'object'.
+        # - Reuse the original index array to keep the specialized dtype:
+        #   v.to_numpy() converts the array dtype to array of 'object' dtype.
+        #   Thus removing the specialized index dtype required to pass a
+        #   schema's index specialized dtype: eg:
+        #   pandera.typing.Index(pandas.Int64Dtype)
+        # - For Pyspark only, use to_numpy(), with the effect of keeping the
+        #   bug open on this execution environment: At the time of writing,
+        #   pyspark v3.3.0 does not provide a working implementation of
+        #   v.array
         multiindex_cls = pd.MultiIndex
+        get_level_array: Callable[..., Iterable] = attrgetter("array")
         # NOTE: this is a hack to support pyspark.pandas
         if type(check_obj).__module__.startswith("pyspark.pandas"):
             # pylint: disable=import-outside-toplevel
             import pyspark.pandas as ps
 
             multiindex_cls = ps.MultiIndex
+            get_level_array = methodcaller("to_numpy")
 
         return multiindex_cls.from_arrays(
             [
-                # v.dtype may be different than 'object'.
-                # - Reuse the original index array to keep the specialized dtype:
-                #   v.to_numpy()  converts the array dtype to array of 'object' dtype.
-                #   Thus removing the specialized index dtype required to pass a schema's
-                #   index specialized dtype : eg: pandera.typing.Index(pandas.Int64Dtype)
-                # - For Pyspark only, use to_numpy(), with the effect of keeping the
-                #   bug open on this execution environment: At the time of writing, pyspark
-                #   v3.3.0 does not provide a working implementation of v.array
-                v.to_numpy()
-                if type(v).__module__.startswith("pyspark.pandas")
-                else v.array
-                for _, v in sorted(
-                    coerced_multi_index.items(), key=lambda x: x[0]
+                # levels that aren't specified in the schema are kept as is.
+                get_level_array(
+                    check_obj.get_level_values(level)
+                    if array is None
+                    else array
                 )
+                for level, array in enumerate(coerced_multi_index)
             ],
             names=check_obj.names,
         )
@@ -401,10 +511,16 @@ class MultiIndexBackend(DataFrameSchemaBackend):
         # it leads to some weird behavior when calling coerce_dtype within the
         # DataFrameSchema.validate call. Need to fix this by having MultiIndex
         # not inherit from DataFrameSchema.
-        schema_copy = deepcopy(schema)
-        schema_copy.coerce = False
-        for index in schema_copy.indexes:
+        # Shallow copies are enough here since only the coerce flags and the
+        # level columns are rebound, the dtypes and checks are shared.
+        indexes = []
+        for index in schema.indexes:
+            index = copy(index)
             index.coerce = False
+            indexes.append(index)
+        schema_copy = copy(schema)
+        schema_copy.indexes = indexes
+        schema_copy.coerce = False
 
         # rename integer-based column names in case of duplicate index names,
         # with at least one named index.
@@ -422,7 +538,7 @@ class MultiIndexBackend(DataFrameSchemaBackend):
             for name, (_, column) in zip(
                 index_names, schema_copy.columns.items()
             ):
-                columns[name] = column.set_name(name)
+                columns[name] = copy(column).set_name(name)
             schema_copy.columns = columns
 
         def to_dataframe(multiindex):
@@ -434,11 +550,9 @@ class MultiIndexBackend(DataFrameSchemaBackend):
             if type(multiindex).__module__.startswith("pyspark.pandas"):
                 df = multiindex.to_frame()
             else:
-                df = pd.DataFrame(
-                    {
-                        i: multiindex.get_level_values(i)
-                        for i in range(multiindex.nlevels)
-                    }
+                # positional names keep to_frame from rejecting duplicates.
+                df = multiindex.to_frame(
+                    index=False, name=list(range(multiindex.nlevels))
                 )
                 df.columns = [
                     i if name is None else name
@@ -1,6 +1,6 @@
 """Handle schema errors."""
 
-from typing import Dict, List, Union
+from typing import Dict, Iterable, List, Union
 
 from pandera.errors import SchemaError
 
@@ -49,6 +49,21 @@ class SchemaErrorHandler:
             }
         )
 
+    def extend(
+        self, collected_errors: Iterable[Dict[str, Union[SchemaError, str]]]
+    ):
+        """Collect errors already collected by another handler, raising the
+        first one if lazy is False.
+
+        :param collected_errors: error dictionaries with ``reason_code`` and
+            ``error`` keys, e.g. ``SchemaErrors.schema_errors``.
+        """
+        if not self._lazy:
+            for error_dict in collected_errors:
+                raise error_dict["error"]  # type: ignore[misc]
+            return
+        self._collected_errors.extend(collected_errors)
+
     @property
     def collected_errors(self) -> List[Dict[str, Union[SchemaError, str]]]:
         """Retrieve SchemaError objects collected during lazy validation."""
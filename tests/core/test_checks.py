@@ -389,6 +389,48 @@ def test_raise_warning_series() -> None:
         warning_schema(data)
 
 
+@pytest.mark.parametrize(
+    "data, check, expected_failure_cases, expected_index",
+    [
+        [
+            pd.Series([1, -1, 2, -2, -3]),
+            Check(lambda s: s > 0, n_failure_cases=2),
+            [-1, -2],
+            [1, 3],
+        ],
+        # duplicate index labels
+        [
+            pd.Series([1, -1, 2, -2, -3], index=[0, 1, 1, 2, 2]),
+            Check(lambda s: s > 0, n_failure_cases=2),
+            [-1, -2],
+            [1, 2],
+        ],
+        # nullable boolean check output with missing values
+        [
+            pd.Series(["ab", "cd", None, "xx", "yy"], dtype="string"),
+            Check(
+                lambda s: s.str.startswith("a"),
+                ignore_na=False,
+                n_failure_cases=2,
+            ),
+            ["cd", "xx"],
+            [1, 3],
+        ],
+    ],
+)
+def test_n_failure_cases(
+    data, check, expected_failure_cases, expected_index
+) -> None:
+    """Test that n_failure_cases limits the reported failure cases to the
+    first n failures."""
+    schema = SeriesSchema(checks=check, nullable=True)
+    with pytest.raises(errors.SchemaError) as exc:
+        schema(data)
+    failure_cases = exc.value.failure_cases
+    assert failure_cases["failure_case"].tolist() == expected_failure_cases
+    assert failure_cases["index"].tolist() == expected_index
+
+
 def test_raise_warning_dataframe() -> None:
     """Test that checks with raise_warning=True raise a warning."""
     data = pd.DataFrame({"positive_numbers": [-1, -2, -3]})
@@ -1,6 +1,8 @@
 """Testing the components of the Schema objects."""
 
 import copy
+import pickle
+import re
 from typing import Any, List, Optional, Tuple, Type
 
 import pandas as pd
@@ -242,6 +244,8 @@ def tests_multi_index_subindex_coerce() -> None:
                 validated_df_override.index.get_level_values(level_i).dtype
                 == "object"
             )
+        # validation doesn't mutate the sub indexes of the schema
+        assert [index.coerce for index in indexes] == [True, False] * 2
 
     # coerce=False at the MultiIndex level should result in two type errors
     schema = DataFrameSchema(index=MultiIndex(indexes))
@@ -251,6 +255,34 @@ def tests_multi_index_subindex_coerce() -> None:
         schema(data, lazy=True)
 
 
+def test_multi_index_reflects_index_updates() -> None:
+    """MultiIndex coerce and names should follow changes to its indexes."""
+    multi_index = MultiIndex([Index(str, name="a"), Index(int, name="b")])
+    assert not multi_index.coerce
+    assert multi_index.names == ["a", "b"]
+
+    multi_index.indexes[1].coerce = True
+    multi_index.indexes[0].name = "z"
+    assert multi_index.coerce
+    assert multi_index.names == ["z", "b"]
+
+
+def test_multi_index_coerce_unspecified_levels() -> None:
+    """Levels that aren't in the MultiIndex schema are kept when coercing."""
+    schema = DataFrameSchema(
+        index=MultiIndex([Index(Int, name="a")], coerce=True)
+    )
+    data = pd.DataFrame(
+        index=pd.MultiIndex.from_arrays(
+            [["1", "2"], ["x", "y"]], names=["a", "b"]
+        )
+    )
+    validated_index = schema(data).index
+    assert validated_index.names == ["a", "b"]
+    assert validated_index.get_level_values("a").tolist() == [1, 2]
+    assert validated_index.get_level_values("b").tolist() == ["x", "y"]
+
+
 @pytest.mark.skipif(
     pandas_version().release <= (1, 3, 5),
     reason="MultiIndex dtypes are buggy prior to pandas 1.4.*",
@@ -307,6 +339,32 @@ def test_schema_component_equality_operators():
     assert multi_index == copy.deepcopy(multi_index)
     assert multi_index != not_equal_schema
 
+    # equal components have the same hash
+    assert len({column, copy.deepcopy(column)}) == 1
+    assert len({index, copy.deepcopy(index)}) == 1
+    assert len({multi_index, copy.deepcopy(multi_index)}) == 1
+
+    # components are no longer equal after one of them is modified
+    for component in (column, index, multi_index):
+        component_copy = copy.deepcopy(component)
+        component_copy.coerce = True
+        assert component != component_copy
+
+
+@pytest.mark.parametrize(
+    "component",
+    [
+        Column(str, Check.str_length(1, 3), name="abc"),
+        Index(Int, Check.gt(0), name="a"),
+        MultiIndex([Index(str, name="a"), Index(Int, name="b")]),
+    ],
+)
+def test_schema_component_pickle(component) -> None:
+    """Test that schema components can be pickled."""
+    unpickled = pickle.loads(pickle.dumps(component))
+    assert unpickled == component
+    assert unpickled in {component}
+
 
 def test_column_regex() -> None:
     """Test that column regex work on single-level column index."""
@@ -483,6 +541,81 @@ def test_column_regex_matching_non_str_types(
     assert expected_matches == [*matched_columns]
 
 
+@pytest.mark.parametrize(
+    "column_name_regex",
+    [
+        ("foo_.*", ".*"),
+        (".*", "nan"),
+        ("foo_1", "ba.*"),
+        ("bar", ".*"),
+    ],
+)
+def test_column_regex_matching_multiindex_levels(
+    column_name_regex: Tuple[str, str],
+) -> None:
+    """Regex matching on MultiIndex levels should handle missing labels and
+    unused level values."""
+    columns = pd.MultiIndex.from_tuples(
+        [
+            ("foo_1", "bar"),
+            ("foo_2", None),
+            ("foo_1", "baz"),
+            ("bar", "baz"),
+            ("biz", "bar"),
+        ]
+    )[:-1]
+    expected_matches = [
+        column
+        for column in columns
+        if all(
+            re.match(pattern, str(label)) is not None
+            for pattern, label in zip(column_name_regex, column)
+        )
+    ]
+    column_schema = Column(name=column_name_regex, regex=True)
+    matched_columns = column_schema.get_regex_columns(columns)
+    assert [*matched_columns] == expected_matches
+
+
+def test_column_regex_matching_single_level_tuple() -> None:
+    """A single-element tuple regex name should match flat columns."""
+    column_schema = Column(name=("foo_.*",), regex=True)
+    matched_columns = column_schema.get_regex_columns(
+        pd.Index(["foo_1", "bar", "foo_2"])
+    )
+    assert [*matched_columns] == ["foo_1", "foo_2"]
+
+
+@pytest.mark.parametrize(
+    "column_name_regex",
+    [
+        ".*",
+        "^.*",
+        ".+",
+        "^.+",
+        "foo",
+        "^foo",
+        "foo_.*",
+        "^foo_.*",
+        "bar-",
+        r"foo\.*",
+        "f.o_[12]",
+    ],
+)
+def test_column_regex_matching_trivial_patterns(
+    column_name_regex: str,
+) -> None:
+    """Trivial regex patterns should match the same columns as re.match."""
+    columns = pd.Index(["foo", "foo_1", "foo_2", "bar-1", "", "\nfoo", 1, 2.5])
+    column_schema = Column(name=column_name_regex, regex=True)
+    matched_columns = column_schema.get_regex_columns(columns)
+    assert [*matched_columns] == [
+        column
+        for column in columns
+        if re.match(column_name_regex, str(column)) is not None
+    ]
+
+
 @pytest.mark.parametrize(
     "column_name_regex, expected_matches",
     [
@@ -608,6 +741,91 @@ def test_column_type_can_be_set() -> None:
             column_a.dtype = invalid_dtype  # type: ignore [assignment]
 
 
+def test_column_properties_reflect_updates() -> None:
+    """Test that Column properties are kept in sync with its attributes."""
+    column = Column(Int, name="a")
+    properties = column.properties
+    assert properties["name"] == "a"
+    assert properties["dtype"] == Engine.dtype(Int)
+
+    # mutating the returned dictionary doesn't affect the column
+    properties["name"] = "b"
+    assert column.properties["name"] == "a"
+
+    column.set_name("b")
+    column.dtype = Float  # type: ignore [assignment]
+    column.required = False
+    assert column.properties["name"] == "b"
+    assert column.properties["dtype"] == Engine.dtype(Float)
+    assert not column.properties["required"]
+    assert column == Column(Float, name="b", required=False)
+
+
+def test_column_equality_reflects_check_updates() -> None:
+    """Test that Column equality follows in-place changes to its checks."""
+    column = Column(int, name="a")
+    assert column == Column(int, name="a")
+    column.checks.append(Check.gt(0))
+    assert column != Column(int, name="a")
+    assert column == Column(int, Check.gt(0), name="a")
+
+
+def test_schema_component_hash_reflects_updates() -> None:
+    """Test that equal schema components hash equally after in-place
+    changes."""
+    column = Column(int, name="a")
+    hash(column)
+    column.checks.append(Check.gt(0))
+    other = Column(int, Check.gt(0), name="a")
+    assert column == other
+    assert hash(column) == hash(other)
+
+    multi_index = MultiIndex([Index(int, name="a"), Index(str, name="b")])
+    hash(multi_index)
+    multi_index.indexes[0].coerce = True
+    other_multi_index = MultiIndex(
+        [Index(int, name="a", coerce=True), Index(str, name="b")]
+    )
+    assert multi_index == other_multi_index
+    assert hash(multi_index) == hash(other_multi_index)
+
+
+def test_schema_component_check_order_equality() -> None:
+    """Test that Column checks are compared irrespective of their order,
+    while Index checks are compared in order."""
+    checks = [Check.gt(0), Check.lt(10)]
+    assert Column(int, checks, name="a") == Column(int, checks[::-1], name="a")
+    assert Index(int, checks, name="a") != Index(int, checks[::-1], name="a")
+
+    # dictionary attributes are compared irrespective of their order
+    multi_index = MultiIndex([Index(int, name="a"), Index(str, name="b")])
+    other = copy.deepcopy(multi_index)
+    other.columns = dict(reversed(list(other.columns.items())))
+    assert multi_index == other
+    assert hash(multi_index) == hash(other)
+
+
+def test_column_validate_copies_data() -> None:
+    """Test that validating a column without inplace returns a copy."""
+    data = pd.DataFrame({"a": [1, 2, 3]})
+    validated = Column(int, name="a").validate(data)
+    validated.loc[0, "a"] = 99
+    assert data["a"].tolist() == [1, 2, 3]
+
+
+def test_column_coerce_duplicate_columns() -> None:
+    """Test that duplicated columns are coerced column by column."""
+    data = pd.DataFrame([[1, "2", 3], [4, "5", 6]], columns=["a", "a", "b"])
+    validated = Column(Float, name="a", coerce=True).validate(data)
+    assert validated.columns.tolist() == ["a", "a", "b"]
+    assert validated.dtypes.tolist() == [
+        Engine.dtype(Float).type,
+        Engine.dtype(Float).type,
+        data.dtypes["b"],
+    ]
+    assert data.dtypes.iloc[1] == object
+
+
 @pytest.mark.parametrize(
     "multiindex, error",
     [